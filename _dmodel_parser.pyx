@@ -0,0 +1,161 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+# cython: language_level=3
+"""
+Cython port of the DMODEL polygon command-stream parser.
+
+Build in place with `python setup.py build_ext --inplace` (see
+setup.py). driver_dmodel falls back to the Numba or pure-Python parser
+when this extension has not been compiled, so it is strictly optional.
+"""
+
+import numpy as np
+
+# Record size and triangle yield per opcode; 0 size marks an unknown
+# opcode. Mirrors the tables in driver_dmodel.
+cdef unsigned char OP_SIZE[256]
+cdef unsigned char OP_TRIS[256]
+
+OP_SIZE[0x10] = 0x10; OP_TRIS[0x10] = 1
+OP_SIZE[0x12] = 0x14; OP_TRIS[0x12] = 1
+OP_SIZE[0x13] = 0x16; OP_TRIS[0x13] = 0
+OP_SIZE[0x14] = 0x14; OP_TRIS[0x14] = 1
+OP_SIZE[0x15] = 0x18; OP_TRIS[0x15] = 2
+OP_SIZE[0x16] = 0x18; OP_TRIS[0x16] = 1
+OP_SIZE[0x17] = 0x20; OP_TRIS[0x17] = 2
+
+
+def parse(const unsigned char[::1] buf, Py_ssize_t cmd_offset, Py_ssize_t cmd_count):
+    """
+    Walk the polygon command stream exactly like Driver_BuildPolys.
+
+    Returns (tris uint16 (T,3), uvs uint8 (T,3,2) raw 1/256-scaled
+    bytes, mat_ids uint8 (T,)), matching the Numba and pure-Python
+    parsers in driver_dmodel.
+    """
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef Py_ssize_t p = cmd_offset
+    cdef Py_ssize_t i, t, q
+    cdef Py_ssize_t total = 0
+    cdef int op, size
+    cdef int a, b, c, d, mesh_id
+    cdef unsigned char uA, vA, uB, vB, uC, vC, uD, vD
+
+    # First pass: size the outputs and validate the stream from the
+    # opcode tables alone. Requiring the whole record to fit is what
+    # lets the unchecked decode pass below stay in bounds.
+    for i in range(cmd_count):
+        if p >= n:
+            raise ValueError(f"Command buffer overrun at command {i}, offset 0x{p:x}")
+        op = buf[p]
+        size = OP_SIZE[op]
+        if size == 0:
+            raise ValueError(f"Unknown opcode 0x{op:02X} at offset 0x{p:X}")
+        if p + size > n:
+            raise ValueError(f"Truncated record at command {i}, offset 0x{p:x}")
+        total += OP_TRIS[op]
+        p += size
+
+    tris_arr = np.empty((total, 3), np.uint16)
+    # Zero-filled up front so the no-UV opcodes never touch it.
+    uvs_arr = np.zeros((total, 3, 2), np.uint8)
+    mat_arr = np.empty(total, np.uint8)
+
+    cdef unsigned short[:, ::1] tris = tris_arr
+    cdef unsigned char[:, :, ::1] uvs = uvs_arr
+    cdef unsigned char[::1] mat_ids = mat_arr
+
+    p = cmd_offset
+    t = 0
+    for i in range(cmd_count):
+        op = buf[p]
+        mesh_id = buf[p + 1]
+
+        if op == 0x10:
+            # simple triangle, indices only
+            tris[t, 0] = buf[p + 2] | (buf[p + 3] << 8)
+            tris[t, 1] = buf[p + 4] | (buf[p + 5] << 8)
+            tris[t, 2] = buf[p + 6] | (buf[p + 7] << 8)
+            mat_ids[t] = mesh_id
+            t += 1
+
+        elif op == 0x12:
+            # triangle with reordered indices, no UVs
+            a = buf[p + 2] | (buf[p + 3] << 8)
+            b = buf[p + 4] | (buf[p + 5] << 8)
+            c = buf[p + 6] | (buf[p + 7] << 8)
+            tris[t, 0] = c
+            tris[t, 1] = b
+            tris[t, 2] = a
+            mat_ids[t] = mesh_id
+            t += 1
+
+        elif op == 0x14 or op == 0x16:
+            # single triangle with UVs; 0x16 is the same record with
+            # the UV block 4 bytes later
+            a = buf[p + 2] | (buf[p + 3] << 8)
+            b = buf[p + 4] | (buf[p + 5] << 8)
+            c = buf[p + 6] | (buf[p + 7] << 8)
+            tris[t, 0] = c
+            tris[t, 1] = b
+            tris[t, 2] = a
+
+            q = p + 0x0A if op == 0x14 else p + 0x0E
+            uvs[t, 2, 0] = buf[q]
+            uvs[t, 2, 1] = buf[q + 1]
+            uvs[t, 1, 0] = buf[q + 2]
+            uvs[t, 1, 1] = buf[q + 3]
+            uvs[t, 0, 0] = buf[q + 4]
+            uvs[t, 0, 1] = buf[q + 5]
+
+            mat_ids[t] = mesh_id
+            t += 1
+
+        elif op == 0x15 or op == 0x17:
+            # quad to two triangles with UVs; 0x17 is the same record
+            # with the UV block 8 bytes later
+            a = buf[p + 2] | (buf[p + 3] << 8)
+            b = buf[p + 4] | (buf[p + 5] << 8)
+            c = buf[p + 6] | (buf[p + 7] << 8)
+            d = buf[p + 8] | (buf[p + 9] << 8)
+
+            q = p + 0x0C if op == 0x15 else p + 0x14
+            uC = buf[q]
+            vC = buf[q + 1]
+            uB = buf[q + 2]
+            vB = buf[q + 3]
+            uA = buf[q + 4]
+            vA = buf[q + 5]
+            uD = buf[q + 6]
+            vD = buf[q + 7]
+
+            # tri0 = (C, B, A)
+            tris[t, 0] = c
+            tris[t, 1] = b
+            tris[t, 2] = a
+            uvs[t, 0, 0] = uA
+            uvs[t, 0, 1] = vA
+            uvs[t, 1, 0] = uB
+            uvs[t, 1, 1] = vB
+            uvs[t, 2, 0] = uC
+            uvs[t, 2, 1] = vC
+            mat_ids[t] = mesh_id
+            t += 1
+
+            # tri1 = (D, C, A)
+            tris[t, 0] = d
+            tris[t, 1] = c
+            tris[t, 2] = a
+            uvs[t, 0, 0] = uD
+            uvs[t, 0, 1] = vD
+            uvs[t, 1, 0] = uA
+            uvs[t, 1, 1] = vA
+            uvs[t, 2, 0] = uC
+            uvs[t, 2, 1] = vC
+            mat_ids[t] = mesh_id
+            t += 1
+
+        # 0x13 carries no geometry; nothing to write.
+
+        p += OP_SIZE[op]
+
+    return tris_arr, uvs_arr, mat_arr
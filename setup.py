@@ -0,0 +1,28 @@
+"""
+Optional build script for the Cython command-stream parser.
+
+    python setup.py build_ext --inplace
+
+drops _dmodel_parser.*.so next to driver_dmodel.py, which then picks it
+up automatically. Without Cython (or a compiler) the addon still works
+through its Numba or pure-Python parser.
+"""
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [Extension("_dmodel_parser", ["_dmodel_parser.pyx"])],
+        language_level=3,
+    )
+
+setup(
+    name="blender-dmodel",
+    version="1.0.0",
+    py_modules=["driver_dmodel"],
+    ext_modules=ext_modules,
+)